@@ -8,28 +8,94 @@ Requires the Marketplace template to be installed first.
 from __future__ import annotations
 
 import argparse
+import base64
 import csv
+import functools
+import http.client
 import json
+import random
+import sys
+import threading
 import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from getpass import getpass
 from pathlib import Path
-from typing import Dict, Optional
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
 PROJECT_ROOT = Path(__file__).parent.parent
 DEFAULT_SAMPLE_DATA_DIR = PROJECT_ROOT / "product" / "sample_data"
 DEFAULT_QUESTIONS_CSV = PROJECT_ROOT / "product" / "packs" / "saas_core" / "questions.csv"
+STATE_PATH = PROJECT_ROOT / ".notion_bootstrap_state.json"
+STATE_SAVE_INTERVAL = 25
 
 NOTION_API_BASE = "https://api.notion.com/v1"
 NOTION_VERSION = "2025-09-03"
+NOTION_TIMEOUT = 30
+MAX_CONCURRENT_REQUESTS = 3
+SEARCH_PAGE_SIZE = 3
+# Check at most this many results in total, the same as the old single
+# 10-result search; a miss on the first page fetches the rest in one request.
+SEARCH_MAX_RESULTS = 10
+MAX_RETRIES = 5
+RETRY_BACKOFF_BASE = 0.5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_API_URL = urlsplit(NOTION_API_BASE)
+_connections = threading.local()
+_parents: Dict[str, dict] = {}
+# Select columns draw from a handful of names, so their property values are
+# built once and shared between pages. They must never be mutated.
+_select_values: Dict[str, dict] = {}
+_select_options: Dict[str, dict] = {}
 
 
 class BootstrapError(Exception):
     pass
 
 
+class TokenBucket:
+    """Thread-safe token bucket shared by every Notion API call."""
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        # last_refill lies in the future while the bucket is paused by drain().
+        now = time.monotonic()
+        if now > self.last_refill:
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                paused = max(0.0, self.last_refill - time.monotonic())
+                delay = paused + (1 - self.tokens) / self.rate
+            time.sleep(delay + random.uniform(0, 0.05))
+
+    def drain(self, delay: float = 0.0) -> None:
+        """Empty the bucket and hold every caller of acquire() for delay seconds."""
+        with self._lock:
+            self._refill()
+            self.tokens = 0
+            self.last_refill = max(self.last_refill, time.monotonic() + delay)
+
+
+# Notion allows an average of three requests per second per integration.
+_LIMITER = TokenBucket(capacity=3, rate=2.8)
+
+
 @dataclass
 class BootstrapPlan:
     questions: int
@@ -38,13 +104,28 @@ class BootstrapPlan:
     assessment_items: int
 
 
+@dataclass(frozen=True)
+class ImportSchema:
+    """How one CSV file maps onto the properties of a Notion data source."""
+
+    csv_name: str
+    title_property: str
+    # Joined with " | " to form the page title, which also keys the returned mapping.
+    title_columns: Tuple[str, ...]
+    # (property, column, property type) for plain values.
+    properties: Tuple[Tuple[str, str, str], ...]
+    # (property, column) whose value is the title of a page created earlier.
+    relations: Tuple[Tuple[str, str], ...] = ()
+
+
 def count_csv_rows(csv_path: Path) -> int:
     if not csv_path.exists():
         raise BootstrapError(f"Missing CSV file: {csv_path}")
     with csv_path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        rows = list(reader)
-    return len(rows)
+        reader = csv.reader(handle)
+        next(reader, None)
+        # Blank lines are skipped, matching what DictReader yields on import.
+        return sum(1 for row in reader if row)
 
 
 def build_plan(sample_data_dir: Path, questions_csv: Path) -> BootstrapPlan:
@@ -72,36 +153,130 @@ def format_plan(plan: BootstrapPlan) -> str:
     return "\n".join(lines)
 
 
+def get_connection() -> http.client.HTTPSConnection:
+    # Each worker thread keeps one keep-alive connection and reuses it for every
+    # call, so the TCP/TLS handshake is paid once per thread instead of per page.
+    connection = getattr(_connections, "connection", None)
+    if connection is None:
+        connection = open_connection()
+        _connections.connection = connection
+    return connection
+
+
+def open_connection() -> http.client.HTTPSConnection:
+    # Honour HTTPS_PROXY / NO_PROXY the way urlopen does, tunnelling through the proxy.
+    proxy = getproxies().get("https")
+    if not proxy or proxy_bypass(_API_URL.hostname):
+        return http.client.HTTPSConnection(_API_URL.netloc, timeout=NOTION_TIMEOUT)
+    proxy_url = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    headers = {}
+    if proxy_url.username:
+        credentials = f"{unquote(proxy_url.username)}:{unquote(proxy_url.password or '')}"
+        token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        headers["Proxy-Authorization"] = f"Basic {token}"
+    connection = http.client.HTTPSConnection(
+        proxy_url.hostname, proxy_url.port or 80, timeout=NOTION_TIMEOUT
+    )
+    connection.set_tunnel(_API_URL.netloc, headers=headers)
+    return connection
+
+
+def close_connection() -> None:
+    connection = getattr(_connections, "connection", None)
+    if connection is not None:
+        connection.close()
+        _connections.connection = None
+
+
+def send_request(
+    method: str, path: str, body: Optional[bytes], headers: Dict[str, str]
+) -> http.client.HTTPResponse:
+    for attempt in range(2):
+        connection = get_connection()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            return connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server dropped the idle keep-alive connection; reconnect once.
+            close_connection()
+            if attempt:
+                raise
+    raise AssertionError("unreachable")
+
+
+@functools.lru_cache(maxsize=None)
+def notion_headers(token: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {token}",
+        "Notion-Version": NOTION_VERSION,
+        "Content-Type": "application/json",
+    }
+
+
+def retry_delay(response: http.client.HTTPResponse, attempt: int) -> float:
+    retry_after = response.getheader("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return RETRY_BACKOFF_BASE * 2**attempt + random.uniform(0, RETRY_BACKOFF_BASE)
+
+
 def notion_request(token: str, method: str, path: str, payload: Optional[dict] = None) -> dict:
-    url = f"{NOTION_API_BASE}{path}"
     data = None
     if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-    request = Request(url, data=data, method=method)
-    request.add_header("Authorization", f"Bearer {token}")
-    request.add_header("Notion-Version", NOTION_VERSION)
-    request.add_header("Content-Type", "application/json")
-    try:
-        with urlopen(request) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except HTTPError as exc:
-        body = exc.read().decode("utf-8") if exc.fp else ""
-        raise BootstrapError(f"Notion API error {exc.code}: {body}") from exc
-
-
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    headers = notion_headers(token)
+    for attempt in range(MAX_RETRIES + 1):
+        _LIMITER.acquire()
+        try:
+            response = send_request(method, f"{_API_URL.path}{path}", data, headers)
+            body = response.read().decode("utf-8")
+        except (OSError, http.client.HTTPException) as exc:
+            close_connection()
+            raise BootstrapError(f"Notion API request failed: {exc}") from exc
+        if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+            delay = retry_delay(response, attempt)
+            if response.status == 429:
+                # Pause the shared bucket so every worker, including this one,
+                # waits out Retry-After before the next request.
+                _LIMITER.drain(delay)
+            else:
+                time.sleep(delay)
+            continue
+        if response.status >= 400:
+            raise BootstrapError(f"Notion API error {response.status}: {body}")
+        return json.loads(body)
+    raise AssertionError("unreachable")
+
+
+@functools.lru_cache(maxsize=None)
 def find_data_source_id(token: str, name: str) -> str:
     payload = {
         "filter": {"property": "object", "value": "data_source"},
         "query": name,
-        "page_size": 10,
+        "page_size": SEARCH_PAGE_SIZE,
     }
-    result = notion_request(token, "POST", "/search", payload)
-    results = result.get("results", [])
-    for item in results:
-        title = item.get("title", [])
-        title_text = "".join(part.get("plain_text", "") for part in title)
-        if title_text == name:
-            return item["id"]
+    checked = 0
+    while checked < SEARCH_MAX_RESULTS:
+        result = notion_request(token, "POST", "/search", payload)
+        checked += payload["page_size"]
+        data_source_id = next(
+            (
+                item["id"]
+                for item in result.get("results", [])
+                if "".join(part.get("plain_text", "") for part in item.get("title", [])) == name
+            ),
+            None,
+        )
+        if data_source_id:
+            return data_source_id
+        # Only page further when a near-match name crowded out the exact one.
+        if not result.get("has_more") or not result.get("next_cursor"):
+            break
+        payload["start_cursor"] = result["next_cursor"]
+        payload["page_size"] = SEARCH_MAX_RESULTS - checked
     raise BootstrapError(
         f"Data source not found: {name}. Ensure the template is installed and shared with the integration."
     )
@@ -111,183 +286,372 @@ def build_text_value(value: str) -> list:
     return [{"text": {"content": value}}]
 
 
+def build_select_option(name: str) -> dict:
+    option = _select_options.get(name)
+    if option is None:
+        option = _select_options[name] = {"name": sys.intern(name)}
+    return option
+
+
+def build_select_value(raw: str) -> dict:
+    value = _select_values.get(raw)
+    if value is None:
+        value = _select_values[raw] = {"select": build_select_option(raw)}
+    return value
+
+
+def build_multi_select_value(raw: str) -> dict:
+    parts = [part for part in (v.strip() for v in raw.split(",")) if part]
+    return {"multi_select": [build_select_option(part) for part in parts]}
+
+
+PROPERTY_BUILDERS: Dict[str, Callable[[str], dict]] = {
+    "title": lambda raw: {"title": build_text_value(raw)},
+    "rich_text": lambda raw: {"rich_text": build_text_value(raw)},
+    "select": build_select_value,
+    "multi_select": build_multi_select_value,
+    "number": lambda raw: {"number": float(raw)},
+    "checkbox": lambda raw: {"checkbox": raw.upper() == "TRUE"},
+    "email": lambda raw: {"email": raw},
+    "date": lambda raw: {"date": {"start": raw}},
+    "url": lambda raw: {"url": raw},
+}
+
+
 def build_property_value(prop_type: str, value: str):
     raw = value.strip()
     if raw == "":
         return None
-    if prop_type == "title":
-        return {"title": build_text_value(raw)}
-    if prop_type == "rich_text":
-        return {"rich_text": build_text_value(raw)}
-    if prop_type == "select":
-        return {"select": {"name": raw}}
-    if prop_type == "multi_select":
-        parts = [v.strip() for v in raw.split(",") if v.strip()]
-        return {"multi_select": [{"name": part} for part in parts]}
-    if prop_type == "number":
-        return {"number": float(raw)}
-    if prop_type == "checkbox":
-        return {"checkbox": raw.upper() == "TRUE"}
-    if prop_type == "email":
-        return {"email": raw}
-    if prop_type == "date":
-        return {"date": {"start": raw}}
-    if prop_type == "url":
-        return {"url": raw}
-    return None
+    builder = PROPERTY_BUILDERS.get(prop_type)
+    return builder(raw) if builder else None
 
 
 def create_page(token: str, data_source_id: str, properties: dict) -> str:
-    payload = {
-        "parent": {"type": "data_source_id", "data_source_id": data_source_id},
-        "properties": properties,
-    }
+    parent = _parents.get(data_source_id)
+    if parent is None:
+        parent = _parents.setdefault(
+            data_source_id, {"type": "data_source_id", "data_source_id": data_source_id}
+        )
+    payload = {"parent": parent, "properties": properties}
     result = notion_request(token, "POST", "/pages", payload)
     return result["id"]
 
 
-def import_questions(token: str, data_source_id: str, csv_path: Path) -> Dict[str, str]:
-    mapping: Dict[str, str] = {}
+QUESTION_SCHEMA = ImportSchema(
+    csv_name="questions.csv",
+    title_property="Question",
+    title_columns=("Question",),
+    properties=(
+        ("Question Code", "Question Code", "rich_text"),
+        ("Domain", "Domain", "select"),
+        ("Question Type", "Question Type", "select"),
+        ("Weight", "Weight", "number"),
+        ("Critical", "Critical", "checkbox"),
+        ("Evidence Required", "Evidence Required", "checkbox"),
+        ("Suggested Evidence", "Suggested Evidence", "rich_text"),
+        ("Reference Tags", "Reference Tags", "rich_text"),
+        ("Pack", "Pack", "multi_select"),
+    ),
+)
+
+VENDOR_SCHEMA = ImportSchema(
+    csv_name="vendors.csv",
+    title_property="Vendor",
+    title_columns=("Vendor",),
+    properties=(
+        ("Category", "Category", "select"),
+        ("Criticality", "Criticality", "select"),
+        ("Data Access", "Data Access", "multi_select"),
+        ("Vendor Contact Email", "Vendor Contact Email", "email"),
+        ("Status", "Status", "select"),
+        ("Renewal Date", "Renewal Date", "date"),
+        ("Notes", "Notes", "rich_text"),
+    ),
+)
+
+ASSESSMENT_SCHEMA = ImportSchema(
+    csv_name="assessments.csv",
+    title_property="Assessment",
+    title_columns=("Assessment",),
+    relations=(("Vendor", "Vendor"),),
+    properties=(
+        ("Type", "Type", "select"),
+        ("Scope Pack", "Scope Pack", "select"),
+        ("Status", "Status", "select"),
+        ("Start Date", "Start Date", "date"),
+        ("Due Date", "Due Date", "date"),
+        ("End Date", "End Date", "date"),
+        ("Decision", "Decision", "select"),
+        ("Conditions", "Conditions", "rich_text"),
+        ("Decision Date", "Decision Date", "date"),
+    ),
+)
+
+ASSESSMENT_ITEM_SCHEMA = ImportSchema(
+    csv_name="assessment_items.csv",
+    title_property="Item",
+    title_columns=("Assessment", "Question"),
+    relations=(("Assessment", "Assessment"), ("Question", "Question")),
+    properties=(
+        ("Response Score Raw", "Response Score Raw", "number"),
+        ("Response Text", "Response Text", "rich_text"),
+        ("Evidence Status", "Evidence Status", "select"),
+        ("Finding Severity", "Finding Severity", "select"),
+        ("Notes", "Notes", "rich_text"),
+    ),
+)
+
+
+def column_index(schema: ImportSchema, header: List[str]) -> Dict[str, int]:
+    index = {name: position for position, name in enumerate(header)}
+    columns = [*schema.title_columns, *(column for _, column in schema.relations)]
+    columns.extend(column for _, column, _ in schema.properties)
+    missing = [column for column in columns if column not in index]
+    if missing:
+        raise BootstrapError(f"Missing columns in {schema.csv_name}: {', '.join(missing)}")
+    return index
+
+
+def iter_csv_rows(
+    csv_path: Path, schema: ImportSchema
+) -> Iterator[Tuple[List[str], Dict[str, int]]]:
+    """Yield each non-blank row, padded to the header width, with the column index."""
     with csv_path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        index = column_index(schema, header)
         for row in reader:
-            question_title = row["Question"].strip()
-            props = {
-                "Question": build_property_value("title", question_title),
-                "Question Code": build_property_value("rich_text", row["Question Code"]),
-                "Domain": build_property_value("select", row["Domain"]),
-                "Question Type": build_property_value("select", row["Question Type"]),
-                "Weight": build_property_value("number", row["Weight"]),
-                "Critical": build_property_value("checkbox", row["Critical"]),
-                "Evidence Required": build_property_value("checkbox", row["Evidence Required"]),
-                "Suggested Evidence": build_property_value("rich_text", row["Suggested Evidence"]),
-                "Reference Tags": build_property_value("rich_text", row["Reference Tags"]),
-                "Pack": build_property_value("multi_select", row["Pack"]),
-            }
-            props = {k: v for k, v in props.items() if v is not None}
-            page_id = create_page(token, data_source_id, props)
-            mapping[question_title] = page_id
-            time.sleep(0.1)
-    return mapping
-
-
-def import_vendors(token: str, data_source_id: str, csv_path: Path) -> Dict[str, str]:
-    mapping: Dict[str, str] = {}
-    with csv_path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            vendor_name = row["Vendor"].strip()
-            props = {
-                "Vendor": build_property_value("title", vendor_name),
-                "Category": build_property_value("select", row["Category"]),
-                "Criticality": build_property_value("select", row["Criticality"]),
-                "Data Access": build_property_value("multi_select", row["Data Access"]),
-                "Vendor Contact Email": build_property_value("email", row["Vendor Contact Email"]),
-                "Status": build_property_value("select", row["Status"]),
-                "Renewal Date": build_property_value("date", row["Renewal Date"]),
-                "Notes": build_property_value("rich_text", row["Notes"]),
-            }
-            props = {k: v for k, v in props.items() if v is not None}
-            page_id = create_page(token, data_source_id, props)
-            mapping[vendor_name] = page_id
-            time.sleep(0.1)
-    return mapping
+            if not row:
+                continue
+            if len(row) < len(header):
+                row += [""] * (len(header) - len(row))
+            yield row, index
+
+
+def row_title(schema: ImportSchema, row: List[str], index: Dict[str, int]) -> str:
+    return " | ".join(row[index[column]].strip() for column in schema.title_columns)
+
+
+def scan_csv(
+    csv_path: Path, schema: ImportSchema, collect_titles: bool = True
+) -> Tuple[Set[str], Dict[str, Set[str]]]:
+    """Stream a CSV once, collecting its page titles and each relation column's names."""
+    titles: Set[str] = set()
+    references: Dict[str, Set[str]] = {prop: set() for prop, _ in schema.relations}
+    for row, index in iter_csv_rows(csv_path, schema):
+        if collect_titles:
+            titles.add(row_title(schema, row, index))
+        for prop, column in schema.relations:
+            references[prop].add(row[index[column]].strip())
+    return titles, references
+
+
+def validate_references(sample_data_dir: Path, questions_csv: Path) -> None:
+    """Check every relation in the CSVs resolves before any page is created."""
+    question_titles, _ = scan_csv(questions_csv, QUESTION_SCHEMA)
+    vendor_titles, _ = scan_csv(sample_data_dir / "vendors.csv", VENDOR_SCHEMA)
+    assessment_titles, assessment_refs = scan_csv(
+        sample_data_dir / "assessments.csv", ASSESSMENT_SCHEMA
+    )
+    _, item_refs = scan_csv(
+        sample_data_dir / "assessment_items.csv", ASSESSMENT_ITEM_SCHEMA, collect_titles=False
+    )
+    titles = {"Question": question_titles, "Vendor": vendor_titles, "Assessment": assessment_titles}
+    problems = [
+        f"- Unknown {prop.lower()} in {schema.csv_name}: {name}"
+        for schema, references in (
+            (ASSESSMENT_SCHEMA, assessment_refs),
+            (ASSESSMENT_ITEM_SCHEMA, item_refs),
+        )
+        for prop, names in references.items()
+        for name in sorted(names - titles[prop])
+    ]
+    if problems:
+        raise BootstrapError("\n".join(["CSV references do not match:", *problems]))
+
+
+def build_page_properties(
+    schema: ImportSchema,
+    row: List[str],
+    index: Dict[str, int],
+    relation_ids: Dict[str, Dict[str, str]],
+) -> Tuple[str, dict]:
+    title = row_title(schema, row, index)
+    props = []
+    if title:
+        props.append((schema.title_property, build_property_value("title", title)))
+    for prop, column in schema.relations:
+        name = row[index[column]].strip()
+        page_id = relation_ids[prop].get(name)
+        if not page_id:
+            raise BootstrapError(f"Unknown {prop.lower()} in {schema.csv_name}: {name}")
+        props.append((prop, {"relation": [{"id": page_id}]}))
+    props.extend(
+        (prop, value)
+        for prop, column, prop_type in schema.properties
+        if (value := build_property_value(prop_type, row[index[column]])) is not None
+    )
+    return title, dict(props)
 
 
-def import_assessments(
+def import_csv(
     token: str,
     data_source_id: str,
     csv_path: Path,
-    vendor_ids: Dict[str, str],
-) -> Dict[str, str]:
-    mapping: Dict[str, str] = {}
-    with csv_path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            vendor_name = row["Vendor"].strip()
-            vendor_id = vendor_ids.get(vendor_name)
-            if not vendor_id:
-                raise BootstrapError(f"Unknown vendor in assessments.csv: {vendor_name}")
-            assessment_title = row["Assessment"].strip()
-            props = {
-                "Assessment": build_property_value("title", assessment_title),
-                "Vendor": {"relation": [{"id": vendor_id}]},
-                "Type": build_property_value("select", row["Type"]),
-                "Scope Pack": build_property_value("select", row["Scope Pack"]),
-                "Status": build_property_value("select", row["Status"]),
-                "Start Date": build_property_value("date", row["Start Date"]),
-                "Due Date": build_property_value("date", row["Due Date"]),
-                "End Date": build_property_value("date", row["End Date"]),
-                "Decision": build_property_value("select", row["Decision"]),
-                "Conditions": build_property_value("rich_text", row["Conditions"]),
-                "Decision Date": build_property_value("date", row["Decision Date"]),
-            }
-            props = {k: v for k, v in props.items() if v is not None}
-            page_id = create_page(token, data_source_id, props)
-            mapping[assessment_title] = page_id
-            time.sleep(0.1)
-    return mapping
+    schema: ImportSchema,
+    executor: Executor,
+    mapping: Dict[str, str],
+    relation_ids: Optional[Dict[str, Dict[str, str]]] = None,
+    on_progress: Optional[Callable[[], None]] = None,
+) -> Tuple[int, int]:
+    """Create a page per CSV row not yet in mapping; return (created, skipped).
+
+    New page ids are added to mapping in place, even if the import fails.
+    """
+    pending: List[Tuple[str, Future]] = []
+    skipped = 0
+    try:
+        for row, index in iter_csv_rows(csv_path, schema):
+            title, props = build_page_properties(schema, row, index, relation_ids or {})
+            if title in mapping:
+                skipped += 1
+                continue
+            pending.append((title, executor.submit(create_page, token, data_source_id, props)))
+        for count, (title, future) in enumerate(pending, 1):
+            mapping[title] = future.result()
+            if on_progress and count % STATE_SAVE_INTERVAL == 0:
+                on_progress()
+        return len(pending), skipped
+    except BaseException:
+        # Stop queued pages from being created once anything has failed, but
+        # keep the ones already created so a rerun does not duplicate them.
+        for _, future in pending:
+            future.cancel()
+        wait([future for _, future in pending])
+        for title, future in pending:
+            if not future.cancelled() and future.exception() is None:
+                mapping[title] = future.result()
+        raise
+
+
+def load_state(state_path: Path) -> Dict[str, Dict[str, str]]:
+    if not state_path.exists():
+        return {}
+    try:
+        return json.loads(state_path.read_text(encoding="utf-8"))
+    except ValueError as exc:
+        raise BootstrapError(
+            f"Unreadable import state in {state_path}. Delete it to start a fresh import."
+        ) from exc
 
 
-def import_assessment_items(
-    token: str,
-    data_source_id: str,
-    csv_path: Path,
-    assessment_ids: Dict[str, str],
-    question_ids: Dict[str, str],
-) -> None:
-    with csv_path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            assessment_title = row["Assessment"].strip()
-            assessment_id = assessment_ids.get(assessment_title)
-            if not assessment_id:
-                raise BootstrapError(
-                    f"Unknown assessment in assessment_items.csv: {assessment_title}"
-                )
-            question_title = row["Question"].strip()
-            question_id = question_ids.get(question_title)
-            if not question_id:
-                raise BootstrapError(f"Unknown question in assessment_items.csv: {question_title}")
-            title = f"{assessment_title} | {question_title}"
-            props = {
-                "Item": build_property_value("title", title),
-                "Assessment": {"relation": [{"id": assessment_id}]},
-                "Question": {"relation": [{"id": question_id}]},
-                "Response Score Raw": build_property_value("number", row["Response Score Raw"]),
-                "Response Text": build_property_value("rich_text", row["Response Text"]),
-                "Evidence Status": build_property_value("select", row["Evidence Status"]),
-                "Finding Severity": build_property_value("select", row["Finding Severity"]),
-                "Notes": build_property_value("rich_text", row["Notes"]),
-            }
-            props = {k: v for k, v in props.items() if v is not None}
-            create_page(token, data_source_id, props)
-            time.sleep(0.1)
+def save_state(state_path: Path, state: Dict[str, Dict[str, str]]) -> None:
+    temp_path = state_path.with_name(f"{state_path.name}.tmp")
+    temp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    temp_path.replace(state_path)
 
 
 def apply_import(token: str, sample_data_dir: Path, questions_csv: Path) -> None:
-    question_ds = find_data_source_id(token, "Question Library")
-    vendors_ds = find_data_source_id(token, "Vendors")
-    assessments_ds = find_data_source_id(token, "Assessments")
-    items_ds = find_data_source_id(token, "Assessment Items")
-
-    question_ids = import_questions(token, question_ds, questions_csv)
-    vendor_ids = import_vendors(token, vendors_ds, sample_data_dir / "vendors.csv")
-    assessment_ids = import_assessments(
-        token,
-        assessments_ds,
-        sample_data_dir / "assessments.csv",
-        vendor_ids,
-    )
-    import_assessment_items(
-        token,
-        items_ds,
-        sample_data_dir / "assessment_items.csv",
-        assessment_ids,
-        question_ids,
-    )
+    validate_references(sample_data_dir, questions_csv)
+
+    # Page ids already created, keyed by data source id and then page title, so
+    # a rerun after a failure resumes instead of duplicating pages.
+    state = load_state(STATE_PATH)
+
+    def checkpoint() -> None:
+        save_state(STATE_PATH, state)
+
+    skipped_total = 0
+
+    def report(schema: ImportSchema, counts: Tuple[int, int]) -> None:
+        nonlocal skipped_total
+        created, skipped = counts
+        skipped_total += skipped
+        line = f"- {schema.csv_name}: created {created} page(s)"
+        if skipped:
+            line += f", skipped {skipped} row(s) already imported"
+        print(line)
+        checkpoint()
+
+    try:
+        # One pool serves every phase; its size matches the limiter's burst.
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            searches = {
+                name: executor.submit(find_data_source_id, token, name)
+                for name in ("Question Library", "Vendors", "Assessments", "Assessment Items")
+            }
+            question_ds = searches["Question Library"].result()
+            vendors_ds = searches["Vendors"].result()
+            assessments_ds = searches["Assessments"].result()
+            items_ds = searches["Assessment Items"].result()
+
+            if any(state.get(ds) for ds in (question_ds, vendors_ds, assessments_ds, items_ds)):
+                print(f"Resuming import: rows recorded in {STATE_PATH.name} are skipped.")
+            question_ids = state.setdefault(question_ds, {})
+            vendor_ids = state.setdefault(vendors_ds, {})
+            assessment_ids = state.setdefault(assessments_ds, {})
+            item_ids = state.setdefault(items_ds, {})
+
+            report(
+                QUESTION_SCHEMA,
+                import_csv(
+                    token,
+                    question_ds,
+                    questions_csv,
+                    QUESTION_SCHEMA,
+                    executor,
+                    question_ids,
+                    on_progress=checkpoint,
+                ),
+            )
+            report(
+                VENDOR_SCHEMA,
+                import_csv(
+                    token,
+                    vendors_ds,
+                    sample_data_dir / "vendors.csv",
+                    VENDOR_SCHEMA,
+                    executor,
+                    vendor_ids,
+                    on_progress=checkpoint,
+                ),
+            )
+            report(
+                ASSESSMENT_SCHEMA,
+                import_csv(
+                    token,
+                    assessments_ds,
+                    sample_data_dir / "assessments.csv",
+                    ASSESSMENT_SCHEMA,
+                    executor,
+                    assessment_ids,
+                    {"Vendor": vendor_ids},
+                    on_progress=checkpoint,
+                ),
+            )
+            report(
+                ASSESSMENT_ITEM_SCHEMA,
+                import_csv(
+                    token,
+                    items_ds,
+                    sample_data_dir / "assessment_items.csv",
+                    ASSESSMENT_ITEM_SCHEMA,
+                    executor,
+                    item_ids,
+                    {"Assessment": assessment_ids, "Question": question_ids},
+                    on_progress=checkpoint,
+                ),
+            )
+    finally:
+        if state:
+            checkpoint()
 
     print("Import complete. Evidence Inbox remains empty by design.")
+    if skipped_total:
+        print(
+            f"Skipped {skipped_total} row(s) recorded in {STATE_PATH.name}. Deleting it re-imports "
+            "everything from scratch, duplicating pages that still exist in Notion."
+        )
 
 
 def parse_args() -> argparse.Namespace: